@@ -13,13 +13,23 @@ from __future__ import annotations
 
 import argparse
 import ast
+import os
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-HEADER_LINES = [
+HEADER_LINES = (
     "# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.",
     "# SPDX-License-Identifier: Apache-2.0",
-]
+)
+HEADER_TEXT = "\n".join(HEADER_LINES)
+# Header as inserted into a file: followed by a blank line before the body
+HEADER_BLOCK = HEADER_TEXT + "\n\n"
+# The same, for files with Windows line endings
+HEADER_TEXT_CRLF = HEADER_TEXT.replace("\n", "\r\n")
+HEADER_BLOCK_CRLF = HEADER_BLOCK.replace("\n", "\r\n")
 
 EXCLUDED_PATTERNS = [
     ".venv/",
@@ -33,7 +43,8 @@ EXCLUDED_PATTERNS = [
 
 def check_header_correctness(content: str) -> tuple[bool, str]:
     """Check if existing header is correct. Returns (is_correct, issue)."""
-    lines = content.split("\n")[:15]
+    # maxsplit keeps the rest of the file as one unsplit tail
+    lines = content.split("\n", 15)[:15]
 
     # Check for SPDX format
     has_spdx = any("SPDX-FileCopyrightText" in line for line in lines)
@@ -52,16 +63,16 @@ def check_header_correctness(content: str) -> tuple[bool, str]:
     return True, ""
 
 
-def should_skip_file(file_path: Path) -> tuple[bool, str]:
+def should_skip_file(file_path: Path, content: str) -> tuple[bool, str]:
     """Determine if file should be skipped. Returns (should_skip, reason)."""
     # Check exclusion patterns
+    path_str = str(file_path)
     for pattern in EXCLUDED_PATTERNS:
-        if pattern in str(file_path):
+        if pattern in path_str:
             return True, f"matches exclusion pattern: {pattern}"
 
     # Skip nearly empty __init__.py files (namespace packages)
     if file_path.name == "__init__.py":
-        content = file_path.read_text()
         lines = content.strip().split("\n")
         if len(lines) <= 3:
             return True, "nearly empty namespace package"
@@ -74,67 +85,88 @@ def has_shebang(content: str) -> bool:
     return content.startswith("#!")
 
 
-def _check_existing_header(content: str, file_path: Path, verbose: bool) -> tuple[bool, str] | None:
+def detect_newline(content: str) -> str:
+    """Return the file's line ending (CRLF or LF), judged by its first line."""
+    first_line, sep, _ = content.partition("\n")
+    return "\r\n" if sep and first_line.endswith("\r") else "\n"
+
+
+def has_canonical_header(content: str) -> bool:
+    """Check if file already starts with HEADER_LINES (after an optional shebang)."""
+    newline = detect_newline(content)
+    if has_shebang(content):
+        content = content.partition("\n")[2]
+    header_text = HEADER_TEXT if newline == "\n" else HEADER_TEXT_CRLF
+    return content.startswith(header_text)
+
+
+def _check_existing_header(content: str, display_path: Path, verbose: bool) -> tuple[bool, str] | None:
     """Check existing header. Returns result tuple to return early, or None to continue."""
     if "SPDX-FileCopyrightText" not in content and "Copyright" not in content[:500]:
         return None
-    is_correct, issue = check_header_correctness(content)
-    if not is_correct:
-        return False, f"  ⚠️  WARN: {file_path.relative_to(Path.cwd())} - {issue} (manual review needed)"
+    if not has_canonical_header(content):
+        is_correct, issue = check_header_correctness(content)
+        if not is_correct:
+            return False, f"  ⚠️  WARN: {display_path} - {issue} (manual review needed)"
     if verbose:
-        return False, f"  SKIP: {file_path.relative_to(Path.cwd())} (already has correct header)"
+        return False, f"  SKIP: {display_path} (already has correct header)"
     return False, ""
 
 
 def add_header(file_path: Path, dry_run: bool = False, verbose: bool = False) -> tuple[bool, str]:
     """Add SPDX header to file. Returns (modified, message)."""
     try:
-        content = file_path.read_text()
+        content = file_path.read_bytes().decode("utf-8")
     except Exception as e:
         return False, f"ERROR: Could not read {file_path}: {e}"
 
+    display_path = file_path.relative_to(Path.cwd())
+
     # Check if should skip
-    skip, reason = should_skip_file(file_path)
+    skip, reason = should_skip_file(file_path, content)
     if skip:
         if verbose:
-            return False, f"  SKIP: {file_path.relative_to(Path.cwd())} ({reason})"
+            return False, f"  SKIP: {display_path} ({reason})"
         return False, ""
 
     # Check for existing headers
-    existing = _check_existing_header(content, file_path, verbose)
+    existing = _check_existing_header(content, display_path, verbose)
     if existing is not None:
         return existing
 
-    # Determine header placement
-    lines = content.split("\n")
-    insert_line = 0
-
+    # Insert header with blank line after, placed after any shebang, using the
+    # file's own line endings so CRLF files don't end up mixed
+    header_block = HEADER_BLOCK if detect_newline(content) == "\n" else HEADER_BLOCK_CRLF
     if has_shebang(content):
-        insert_line = 1  # After shebang
-
-    # Insert header with blank line after
-    new_lines = (
-        lines[:insert_line]
-        + HEADER_LINES
-        + [""]  # Blank line after header
-        + lines[insert_line:]
-    )
-    new_content = "\n".join(new_lines)
+        shebang, _, body = content.partition("\n")
+        new_content = f"{shebang}\n{header_block}{body}"
+    else:
+        new_content = header_block + content
 
     # Validate syntax before writing
     try:
         ast.parse(new_content)
     except SyntaxError as e:
-        return False, f"  ERROR: {file_path.relative_to(Path.cwd())} - Invalid syntax after header: {e}"
+        return False, f"  ERROR: {display_path} - Invalid syntax after header: {e}"
 
     if dry_run:
-        return True, f"  DRY-RUN: Would add header to {file_path.relative_to(Path.cwd())}"
+        return True, f"  DRY-RUN: Would add header to {display_path}"
 
-    # Write file atomically
+    # Write file atomically: fill a unique temp file next to the real file (through
+    # any symlink), then rename it over that file
+    target = file_path.resolve()
+    tmp_path: Path | None = None
     try:
-        file_path.write_text(new_content)
-        return True, f"  ✓ Added header to {file_path.relative_to(Path.cwd())}"
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(new_content.encode("utf-8"))
+        shutil.copymode(target, tmp_path)
+        tmp_path.replace(target)
+        return True, f"  ✓ Added header to {display_path}"
     except Exception as e:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
         return False, f"  ERROR: Could not write {file_path}: {e}"
 
 
@@ -143,9 +175,16 @@ def find_python_files(root: Path) -> list[Path]:
     files = []
     for pattern in ["src/**/*.py", "scripts/*.py", "tests/*.py"]:
         for p in root.glob(pattern):
-            if not any(excl in str(p) for excl in EXCLUDED_PATTERNS):
+            p_str = str(p)
+            if not any(excl in p_str for excl in EXCLUDED_PATTERNS):
                 files.append(p)
-    return sorted(set(files))
+
+    # Writes go through symlinks to the real file, so keep one path per real file;
+    # otherwise two workers could both add a header to it
+    unique_files = {}
+    for p in sorted(set(files)):
+        unique_files.setdefault(p.resolve(), p)
+    return list(unique_files.values())
 
 
 def main() -> int:
@@ -157,7 +196,12 @@ def main() -> int:
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Show detailed output including skipped files"
     )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None, help="Number of files to process in parallel (default: auto)"
+    )
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     root = Path.cwd()
     python_files = find_python_files(root)
@@ -173,18 +217,23 @@ def main() -> int:
     skipped = 0
     warnings = 0
 
-    for file_path in python_files:
-        was_modified, message = add_header(file_path, dry_run=args.dry_run, verbose=args.verbose)
-
-        if message:
-            print(message)
-
-        if "WARN:" in message:
-            warnings += 1
-        elif was_modified:
-            modified += 1
-        else:
-            skipped += 1
+    # Files are independent, so read/check/write them concurrently; results come
+    # back in input order, keeping the report deterministic.
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        results = executor.map(
+            lambda file_path: add_header(file_path, dry_run=args.dry_run, verbose=args.verbose),
+            python_files,
+        )
+        for was_modified, message in results:
+            if message:
+                print(message)
+
+            if "WARN:" in message:
+                warnings += 1
+            elif was_modified:
+                modified += 1
+            else:
+                skipped += 1
 
     print()
     print("=" * 70)
@@ -4,7 +4,6 @@
 
 """Extract package name from built artifacts."""
 
-import re
 import sys
 from pathlib import Path
 
@@ -17,15 +16,13 @@ def main() -> None:
 
     artifacts_path = Path(sys.argv[1])
 
-    # Look for wheel or tarball files
-    for file_path in artifacts_path.iterdir():
-        if file_path.is_file() and (file_path.suffix == ".whl" or file_path.name.endswith(".tar.gz")):
-            filename = file_path.name
-            match = re.match(r"^([^-]+)", filename)
-            if match:
-                package_name = match.group(1).replace("_", "-")
-                print(package_name)
-                return
+    # Look for wheel files first, then fall back to tarball files
+    file_path = next(artifacts_path.glob("*.whl"), None) or next(artifacts_path.glob("*.tar.gz"), None)
+    if file_path is not None:
+        package_name = file_path.name.partition("-")[0].replace("_", "-")
+        if package_name:
+            print(package_name)
+            return
 
     print("unknown", file=sys.stderr)
     sys.exit(1)
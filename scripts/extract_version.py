@@ -8,18 +8,24 @@ import re
 import sys
 from pathlib import Path
 
+# Wheel versions never contain "-", so a negated class stops at the separator
+# without lazy-quantifier backtracking. Sdist versions may (e.g. "1.0.0-rc1"),
+# so the tarball pattern runs up to the anchored ".tar.gz" suffix instead.
+_WHEEL_VERSION_RE = re.compile(r"-([0-9]+\.[0-9]+\.[0-9]+[^-]*)-")
+_TARBALL_VERSION_RE = re.compile(r"-([0-9]+\.[0-9]+\.[0-9]+[^/]*?)\.tar\.gz\Z")
+
 
 def extract_version_from_wheel(wheel_path: str) -> str:
     """Extract version from wheel filename."""
     filename = Path(wheel_path).name
-    match = re.search(r"-([0-9]+\.[0-9]+\.[0-9]+.*?)-", filename)
+    match = _WHEEL_VERSION_RE.search(filename)
     return match.group(1) if match else "0.0.0"
 
 
 def extract_version_from_tarball(tarball_path: str) -> str:
     """Extract version from tarball filename."""
     filename = Path(tarball_path).name
-    match = re.search(r"-([0-9]+\.[0-9]+\.[0-9]+.*?)\.tar\.gz", filename)
+    match = _TARBALL_VERSION_RE.search(filename)
     return match.group(1) if match else "0.0.0"
 
 
@@ -32,16 +38,16 @@ def main() -> None:
     artifacts_path = Path(sys.argv[1])
 
     # Look for wheel files first
-    wheel_files = list(artifacts_path.glob("*.whl"))
-    if wheel_files:
-        version = extract_version_from_wheel(str(wheel_files[0]))
+    wheel_file = next(artifacts_path.glob("*.whl"), None)
+    if wheel_file is not None:
+        version = extract_version_from_wheel(wheel_file.name)
         print(version)
         return
 
     # Fall back to tarball files
-    tarball_files = list(artifacts_path.glob("*.tar.gz"))
-    if tarball_files:
-        version = extract_version_from_tarball(str(tarball_files[0]))
+    tarball_file = next(artifacts_path.glob("*.tar.gz"), None)
+    if tarball_file is not None:
+        version = extract_version_from_tarball(tarball_file.name)
         print(version)
         return
 
@@ -13,30 +13,116 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import os
+import stat
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+SHARED_ACTIONS = {
+    "setup-python": "provide-io/ci-tooling/actions/setup-python-env@v0",
+    "python-quality": "provide-io/ci-tooling/actions/python-quality@v0",
+    "python-test": "provide-io/ci-tooling/actions/python-test@v0",
+    "python-security": "provide-io/ci-tooling/actions/python-security@v0",
+    "python-build": "provide-io/ci-tooling/actions/python-build@v0",
+    "python-release": "provide-io/ci-tooling/actions/python-release@v0",
+}
+
+REUSABLE_WORKFLOWS = {
+    "python-ci": "provide-io/ci-tooling/workflows/python-ci.yml@v0",
+    "python-release": "provide-io/ci-tooling/workflows/python-release.yml@v0",
+}
+
+# Jobs sections of the migrated workflows. Only the name/on header varies with the
+# original workflow, so these are rendered once at import time.
+REUSABLE_WORKFLOW_JOBS = f"""\
+jobs:
+  ci:
+    uses: {REUSABLE_WORKFLOWS["python-ci"]}
+    with:
+      python-version: '3.11'
+      matrix-testing: true
+      run-security: true
+    secrets:
+      CODECOV_TOKEN: ${{{{ secrets.CODECOV_TOKEN }}}}
+"""
+
+ACTION_BASED_WORKFLOW_JOBS = f"""\
+jobs:
+  quality:
+    name: 🔧 Code Quality
+    runs-on: ubuntu-latest
+    steps:
+    - uses: actions/checkout@v4
+    - uses: {SHARED_ACTIONS["setup-python"]}
+      with:
+        python-version: '3.11'
+        uv-version: 0.11.3
+    - uses: {SHARED_ACTIONS["python-quality"]}
+  test:
+    name: 🧪 Tests
+    needs: quality
+    runs-on: ubuntu-latest
+    steps:
+    - uses: actions/checkout@v4
+    - uses: {SHARED_ACTIONS["setup-python"]}
+      with:
+        python-version: '3.11'
+        uv-version: 0.11.3
+    - uses: {SHARED_ACTIONS["python-test"]}
+      with:
+        coverage-threshold: 80
+"""
+
+# Below this many workflow files, process pool startup costs more than parsing serially.
+PARALLEL_MIN_WORKFLOWS = 8
+
+# Keywords that identify a tool, per workflow step field, as (keyword, tool) pairs.
+# Step names are matched case-insensitively; "uses" and "run" are matched as written.
+STEP_TOOL_KEYWORDS = {
+    "name": (
+        ("python", "python"),
+        ("uv", "uv"),
+        ("ruff", "ruff"),
+        ("mypy", "mypy"),
+        ("test", "pytest"),
+        ("security", "security"),
+    ),
+    "uses": (("setup-python", "python"),),
+    "run": (
+        ("uv", "uv"),
+        ("ruff", "ruff"),
+        ("mypy", "mypy"),
+        ("pytest", "pytest"),
+        ("bandit", "security"),
+        ("safety", "security"),
+    ),
+}
+KNOWN_TOOLS = frozenset(tool for keywords in STEP_TOOL_KEYWORDS.values() for _, tool in keywords)
+
+# Job-level patterns reported by _detect_job_patterns, and the tool sets behind them.
+JOB_PATTERNS = ("python-setup", "python-quality", "python-test", "python-security")
+PYTHON_SETUP_TOOLS = frozenset({"python", "uv"})
+QUALITY_TOOLS = frozenset({"ruff", "mypy"})
+SECURITY_TOOLS = frozenset({"bandit", "safety", "security"})
+
 
 class WorkflowMigrator:
     """Migrates existing GitHub workflows to use shared actions."""
 
     def __init__(self) -> None:
-        self.shared_actions = {
-            "setup-python": "provide-io/ci-tooling/actions/setup-python-env@v0",
-            "python-quality": "provide-io/ci-tooling/actions/python-quality@v0",
-            "python-test": "provide-io/ci-tooling/actions/python-test@v0",
-            "python-security": "provide-io/ci-tooling/actions/python-security@v0",
-            "python-build": "provide-io/ci-tooling/actions/python-build@v0",
-            "python-release": "provide-io/ci-tooling/actions/python-release@v0",
-        }
-
-        self.reusable_workflows = {
-            "python-ci": "provide-io/ci-tooling/workflows/python-ci.yml@v0",
-            "python-release": "provide-io/ci-tooling/workflows/python-release.yml@v0",
-        }
+        self._parse_cache: dict[tuple[str, int, int], Any] = {}
+        self._migrated_cache: dict[tuple[bytes, str], str] = {}
 
     def analyze_project(self, project_path: str) -> dict[str, Any]:
         """Analyze a project to suggest migration strategy."""
@@ -48,27 +134,41 @@ class WorkflowMigrator:
             "complexity": "low",
         }
 
-        # Check project type
-        if (project_path / "pyproject.toml").exists():
+        # Check project type from a single listing of the project root
+        try:
+            with os.scandir(project_path) as entries:
+                top_level_names = {entry.name for entry in entries}
+        except OSError:
+            top_level_names = set()
+
+        if "pyproject.toml" in top_level_names:
             analysis["project_type"] = "python"
-        elif (project_path / "setup.py").exists():
+        elif "setup.py" in top_level_names:
             analysis["project_type"] = "python-legacy"
-        elif (project_path / "main.tf").exists():
+        elif "main.tf" in top_level_names:
             analysis["project_type"] = "terraform"
 
         # Find existing workflows
         workflows_dir = project_path / ".github" / "workflows"
         if workflows_dir.exists():
-            for workflow_file in workflows_dir.glob("*.yml"):
-                try:
-                    with workflow_file.open() as f:
-                        workflow_data = yaml.safe_load(f)
-
-                    workflow_analysis = self._analyze_workflow(workflow_data)
-                    workflow_analysis["file"] = str(workflow_file)
+            with os.scandir(workflows_dir) as entries:
+                workflow_files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+                ]
+            if len(workflow_files) >= PARALLEL_MIN_WORKFLOWS:
+                with ProcessPoolExecutor() as executor:
+                    results = list(executor.map(_parse_and_analyze, workflow_files))
+            else:
+                results = [_parse_and_analyze(workflow_file, self) for workflow_file in workflow_files]
+
+            for workflow_analysis in results:
+                error = workflow_analysis.get("error")
+                if error is not None:
+                    print(f"Warning: Could not parse {workflow_analysis['file']}: {error}")
+                else:
                     analysis["workflows"].append(workflow_analysis)
-                except Exception as e:
-                    print(f"Warning: Could not parse {workflow_file}: {e}")
 
         # Generate suggestions
         analysis["migration_suggestions"] = self._generate_suggestions(analysis)
@@ -76,6 +176,20 @@ class WorkflowMigrator:
 
         return analysis
 
+    def _load_workflow(self, workflow_file: Path, raw: bytes | None = None) -> dict[str, Any]:
+        """Load and parse a workflow YAML file, reusing the result while the file is unchanged.
+
+        Callers that already hold the file's bytes pass them as ``raw`` so the file
+        is not read a second time.
+        """
+        file_stat = workflow_file.stat()
+        cache_key = (str(workflow_file), file_stat.st_mtime_ns, file_stat.st_size)
+        if cache_key not in self._parse_cache:
+            if raw is None:
+                raw = workflow_file.read_bytes()
+            self._parse_cache[cache_key] = yaml.load(raw, Loader=_SafeLoader)
+        return self._parse_cache[cache_key]
+
     def _analyze_workflow(self, workflow_data: dict[str, Any]) -> dict[str, Any]:
         """Analyze a single workflow file."""
         analysis = {
@@ -101,65 +215,58 @@ class WorkflowMigrator:
         """Analyze a single job."""
         steps = job_data.get("steps", [])
 
-        job_analysis = {
+        # Analyze steps, stopping early once every known tool has been seen
+        tools: set[str] = set()
+        for step in steps:
+            if isinstance(step, dict):
+                self._detect_tools_in_step(step, tools)
+                if len(tools) == len(KNOWN_TOOLS):
+                    break
+
+        return {
             "name": job_name,
             "runner": job_data.get("runs-on", "unknown"),
             "step_count": len(steps),
-            "patterns": [],
-            "tools_used": [],
+            "patterns": self._detect_job_patterns(tools),
+            "tools_used": tools,
         }
 
-        # Analyze steps
-        for step in steps:
-            if isinstance(step, dict):
-                self._detect_tools_in_step(step, job_analysis["tools_used"])
-
-        # Detect patterns based on tools
-        job_analysis["patterns"] = self._detect_job_patterns(set(job_analysis["tools_used"]))
-
-        return job_analysis
-
-    def _detect_tools_in_step(self, step: dict[str, Any], tools_used: list[str]) -> None:
+    def _detect_tools_in_step(self, step: dict[str, Any], tools_used: set[str]) -> None:
         """Detect tools used in a workflow step."""
-        step_name = step.get("name", "")
-        step_uses = step.get("uses", "")
-        step_run = step.get("run", "")
-
-        if "python" in step_name.lower() or "setup-python" in step_uses:
-            tools_used.append("python")
-        if "uv" in step_run or "uv" in step_name.lower():
-            tools_used.append("uv")
-        if "ruff" in step_run or "ruff" in step_name.lower():
-            tools_used.append("ruff")
-        if "mypy" in step_run or "mypy" in step_name.lower():
-            tools_used.append("mypy")
-        if "pytest" in step_run or "test" in step_name.lower():
-            tools_used.append("pytest")
-        if "bandit" in step_run or "safety" in step_run or "security" in step_name.lower():
-            tools_used.append("security")
+        step_fields = {
+            "name": step.get("name", "").lower(),
+            "uses": step.get("uses", ""),
+            "run": step.get("run", ""),
+        }
+        tools_used.update(
+            tool
+            for field, keywords in STEP_TOOL_KEYWORDS.items()
+            for keyword, tool in keywords
+            if keyword in step_fields[field]
+        )
 
     def _detect_job_patterns(self, tools: set[str]) -> list[str]:
         """Detect patterns based on tools used."""
         patterns = []
-        if {"python", "uv"} <= tools:
+        if PYTHON_SETUP_TOOLS.issubset(tools):
             patterns.append("python-setup")
-        if {"ruff"} <= tools or {"mypy"} <= tools:
+        if not QUALITY_TOOLS.isdisjoint(tools):
             patterns.append("python-quality")
-        if {"pytest"} <= tools:
+        if "pytest" in tools:
             patterns.append("python-test")
-        if any(tool in tools for tool in ["bandit", "safety", "security"]):
+        if not SECURITY_TOOLS.isdisjoint(tools):
             patterns.append("python-security")
         return patterns
 
     def _detect_patterns(self, jobs: list[dict[str, Any]]) -> list[str]:
         """Detect workflow-level patterns."""
         patterns = []
-        all_tools = set()
         all_patterns = set()
 
         for job in jobs:
-            all_tools.update(job["tools_used"])
             all_patterns.update(job["patterns"])
+            if len(all_patterns) == len(JOB_PATTERNS):
+                break
 
         if "python-setup" in all_patterns and "python-test" in all_patterns:
             patterns.append("standard-ci")
@@ -184,16 +291,24 @@ class WorkflowMigrator:
 
     def _assess_complexity(self, analysis: dict[str, Any]) -> str:
         """Assess overall project complexity for migration."""
-        workflow_count = len(analysis["workflows"])
-        high_potential = sum(1 for w in analysis["workflows"] if w["migration_potential"] == "high")
-
-        if workflow_count <= 2 and high_potential >= 1:
-            return "low"
-        elif workflow_count <= 5 and high_potential >= workflow_count // 2:
-            return "medium"
-        else:
+        workflows = analysis["workflows"]
+        workflow_count = len(workflows)
+        if workflow_count > 5:
             return "high"
 
+        # Count high-potential workflows only until the result is settled
+        medium_threshold = workflow_count // 2
+        high_potential = 0
+        for workflow in workflows:
+            if workflow["migration_potential"] == "high":
+                high_potential += 1
+                if workflow_count <= 2:
+                    return "low"
+                if high_potential >= medium_threshold:
+                    return "medium"
+
+        return "medium" if high_potential >= medium_threshold else "high"
+
     def _generate_suggestions(self, analysis: dict[str, Any]) -> list[str]:
         """Generate migration suggestions."""
         suggestions = []
@@ -222,79 +337,56 @@ class WorkflowMigrator:
         return suggestions
 
     def generate_migrated_workflow(self, original_file: str, strategy: str = "reusable") -> str:
-        """Generate a migrated workflow file."""
-        with Path(original_file).open() as f:
-            original_data = yaml.safe_load(f)
-
-        if strategy == "reusable":
-            return self._generate_reusable_workflow(original_data)
-        else:
-            return self._generate_action_based_workflow(original_data)
+        """Generate a migrated workflow file.
+
+        Results are memoized on the file contents, so identical workflows (e.g. the
+        same CI template copied across a monorepo) are only parsed and emitted once.
+        """
+        workflow_file = Path(original_file)
+        raw = workflow_file.read_bytes()
+        cache_key = (raw, strategy)
+        migrated = self._migrated_cache.get(cache_key)
+        if migrated is None:
+            original_data = self._load_workflow(workflow_file, raw)
+            if strategy == "reusable":
+                migrated = self._generate_reusable_workflow(original_data)
+            else:
+                migrated = self._generate_action_based_workflow(original_data)
+            self._migrated_cache[cache_key] = migrated
+        return migrated
+
+    def _dump_workflow_header(self, original_data: dict[str, Any]) -> str:
+        """Emit the name and triggers carried over from the original workflow."""
+        header = {
+            "name": original_data.get("name", "CI"),
+            "on": original_data.get("on", {"push": {"branches": ["main"]}, "pull_request": {}}),
+        }
+        return yaml.dump(header, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
 
     def _generate_reusable_workflow(self, original_data: dict[str, Any]) -> str:
         """Generate workflow using reusable workflows."""
-        workflow_name = original_data.get("name", "CI")
-        triggers = original_data.get("on", {"push": {"branches": ["main"]}, "pull_request": {}})
-
-        migrated = {
-            "name": workflow_name,
-            "on": triggers,
-            "jobs": {
-                "ci": {
-                    "uses": self.reusable_workflows["python-ci"],
-                    "with": {
-                        "python-version": "3.11",
-                        "matrix-testing": True,
-                        "run-security": True,
-                    },
-                    "secrets": {"CODECOV_TOKEN": "${{ secrets.CODECOV_TOKEN }}"},
-                }
-            },
-        }
-
-        return yaml.dump(migrated, default_flow_style=False, sort_keys=False)
+        return self._dump_workflow_header(original_data) + REUSABLE_WORKFLOW_JOBS
 
     def _generate_action_based_workflow(self, original_data: dict[str, Any]) -> str:
         """Generate workflow using individual actions."""
-        workflow_name = original_data.get("name", "CI")
-        triggers = original_data.get("on", {"push": {"branches": ["main"]}, "pull_request": {}})
-
-        migrated = {
-            "name": workflow_name,
-            "on": triggers,
-            "jobs": {
-                "quality": {
-                    "name": "🔧 Code Quality",
-                    "runs-on": "ubuntu-latest",
-                    "steps": [
-                        {"uses": "actions/checkout@v4"},
-                        {
-                            "uses": self.shared_actions["setup-python"],
-                            "with": {"python-version": "3.11", "uv-version": "0.11.3"},
-                        },
-                        {"uses": self.shared_actions["python-quality"]},
-                    ],
-                },
-                "test": {
-                    "name": "🧪 Tests",
-                    "needs": "quality",
-                    "runs-on": "ubuntu-latest",
-                    "steps": [
-                        {"uses": "actions/checkout@v4"},
-                        {
-                            "uses": self.shared_actions["setup-python"],
-                            "with": {"python-version": "3.11", "uv-version": "0.11.3"},
-                        },
-                        {
-                            "uses": self.shared_actions["python-test"],
-                            "with": {"coverage-threshold": 80},
-                        },
-                    ],
-                },
-            },
-        }
+        return self._dump_workflow_header(original_data) + ACTION_BASED_WORKFLOW_JOBS
+
 
-        return yaml.dump(migrated, default_flow_style=False, sort_keys=False)
+def _parse_and_analyze(workflow_file: Path, migrator: WorkflowMigrator | None = None) -> dict[str, Any]:
+    """Parse and analyze a workflow file, reporting failures in the result.
+
+    Module-level so process-pool tasks pickle only the path, not a migrator and its
+    caches; serial callers pass their migrator to share its parse cache.
+    """
+    if migrator is None:
+        migrator = WorkflowMigrator()
+    file_name = os.fspath(workflow_file)
+    try:
+        workflow_analysis = migrator._analyze_workflow(migrator._load_workflow(workflow_file))
+    except Exception as e:
+        return {"file": file_name, "error": str(e)}
+    workflow_analysis["file"] = file_name
+    return workflow_analysis
 
 
 def main() -> None:
@@ -313,7 +405,13 @@ def main() -> None:
 
     migrator = WorkflowMigrator()
 
-    if args.analyze or Path(args.target).is_dir():
+    # One stat serves both the directory and the regular-file checks
+    try:
+        target_mode = Path(args.target).stat().st_mode
+    except OSError:
+        target_mode = 0
+
+    if args.analyze or stat.S_ISDIR(target_mode):
         # Analyze project
         analysis = migrator.analyze_project(args.target)
 
@@ -335,7 +433,7 @@ def main() -> None:
 
     else:
         # Migrate specific workflow
-        if not Path(args.target).is_file():
+        if not stat.S_ISREG(target_mode):
             print(f"Error: {args.target} is not a file")
             sys.exit(1)
 
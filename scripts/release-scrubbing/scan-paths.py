@@ -19,6 +19,7 @@ from __future__ import annotations
 import re
 import subprocess  # nosec
 from collections import defaultdict
+from collections.abc import Iterator
 
 REPO = "/Volumes/data/pyv/REPONAME"
 
@@ -44,6 +45,38 @@ def run(args: list[str], stdin: bytes | None = None) -> bytes:
     return subprocess.run(args, cwd=REPO, input=stdin, check=False, capture_output=True).stdout
 
 
+def read_blobs(shas: list[str]) -> Iterator[tuple[str, bytes]]:
+    """Yield (sha, content) for each blob from one `git cat-file --batch` process."""
+    proc = subprocess.Popen(
+        ["git", "cat-file", "--batch"], cwd=REPO, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    try:
+        for sha in shas:
+            proc.stdin.write(sha.encode() + b"\n")
+            proc.stdin.flush()
+            # "<sha> blob <size>", or "<sha> missing" for unknown objects
+            header = proc.stdout.readline().split()
+            if len(header) != 3:
+                yield sha, b""
+                continue
+            data = proc.stdout.read(int(header[2]))
+            proc.stdout.read(1)  # trailing LF
+            yield sha, data
+    finally:
+        proc.stdin.close()
+        proc.wait()
+
+
+def read_commit_messages() -> Iterator[tuple[str, bytes]]:
+    """Yield (sha, message) for every commit from a single `git log --all`."""
+    # -z separates commits with NUL; each record is "<sha>\n<message>"
+    for record in run(["git", "log", "--all", "-z", "--format=%H%n%B"]).split(b"\0"):
+        if record:
+            sha, _, message = record.partition(b"\n")
+            yield sha.decode("ascii"), message
+
+
 def scan_bytes(data: bytes) -> list[bytes]:
     hits: list[bytes] = []
     for pat in ABS_PATTERNS:
@@ -68,44 +101,38 @@ def main() -> int:
     )
     blobs = [row.split()[1] for row in typed.decode().splitlines() if row.startswith("blob ")]
 
-    commits = run(["git", "rev-list", "--all"]).decode("ascii", "replace").split()
-
     blob_hits: dict[str, list[bytes]] = defaultdict(list)
-    for sha in blobs:
-        hits = scan_bytes(run(["git", "cat-file", "-p", sha]))
+    for sha, data in read_blobs(blobs):
+        hits = scan_bytes(data)
         if hits:
             blob_hits[sha] = hits
 
     commit_hits: dict[str, list[bytes]] = defaultdict(list)
-    for sha in commits:
-        hits = scan_bytes(run(["git", "log", "--format=%B", "-n", "1", sha]))
+    commit_count = 0
+    for sha, message in read_commit_messages():
+        commit_count += 1
+        hits = scan_bytes(message)
         if hits:
             commit_hits[sha] = hits
 
-    print(f"scanned blobs={len(blobs)} commits={len(commits)}")
+    print(f"scanned blobs={len(blobs)} commits={commit_count}")
     print(f"blobs with abs-path hits: {len(blob_hits)}")
     print(f"commits with abs-path hits: {len(commit_hits)}")
     print()
 
+    # One listing of tracked paths instead of a `git ls-files` per hit path
+    tracked = set(run(["git", "ls-files", "-z"]).decode("utf-8", "replace").split("\0"))
+
     by_path: dict[str, list[str]] = defaultdict(list)
-    path_at_head: dict[str, bool] = {}
     for sha, hits in blob_hits.items():
         for path in blob_paths.get(sha, {"<unknown>"}):
             for h in hits:
                 by_path[path].append(h.decode("utf-8", "replace"))
-            if path not in path_at_head:
-                r = subprocess.run(
-                    ["git", "ls-files", "--error-unmatch", path],
-                    cwd=REPO,
-                    check=False,
-                    capture_output=True,
-                )
-                path_at_head[path] = r.returncode == 0
 
     print("=== hits by path (HEAD = currently tracked) ===")
     for path in sorted(by_path.keys()):
         uniq = sorted(set(by_path[path]))
-        mark = " [HEAD]" if path_at_head.get(path) else ""
+        mark = " [HEAD]" if path in tracked else ""
         print(f"\n  {path}{mark}  ({len(uniq)} unique leaks)")
         for h in uniq[:5]:
             print(f"    {h}")
@@ -13,6 +13,7 @@ from __future__ import annotations
 import re
 import subprocess  # nosec
 from collections import defaultdict
+from collections.abc import Iterator
 
 REPO = "/Volumes/data/pyv/REPONAME"
 
@@ -52,6 +53,38 @@ def run(args: list[str], stdin: bytes | None = None) -> bytes:
     return subprocess.run(args, cwd=REPO, input=stdin, check=False, capture_output=True).stdout
 
 
+def read_blobs(shas: list[str]) -> Iterator[tuple[str, bytes]]:
+    """Yield (sha, content) for each blob from one `git cat-file --batch` process."""
+    proc = subprocess.Popen(
+        ["git", "cat-file", "--batch"], cwd=REPO, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    try:
+        for sha in shas:
+            proc.stdin.write(sha.encode() + b"\n")
+            proc.stdin.flush()
+            # "<sha> blob <size>", or "<sha> missing" for unknown objects
+            header = proc.stdout.readline().split()
+            if len(header) != 3:
+                yield sha, b""
+                continue
+            data = proc.stdout.read(int(header[2]))
+            proc.stdout.read(1)  # trailing LF
+            yield sha, data
+    finally:
+        proc.stdin.close()
+        proc.wait()
+
+
+def read_commit_messages() -> Iterator[tuple[str, bytes]]:
+    """Yield (sha, message) for every commit from a single `git log --all`."""
+    # -z separates commits with NUL; each record is "<sha>\n<message>"
+    for record in run(["git", "log", "--all", "-z", "--format=%H%n%B"]).split(b"\0"):
+        if record:
+            sha, _, message = record.partition(b"\n")
+            yield sha.decode("ascii"), message
+
+
 def scan(data: bytes) -> dict[str, set[bytes]]:
     hits: dict[str, set[bytes]] = defaultdict(set)
     for name, pat in PATTERNS.items():
@@ -79,14 +112,14 @@ def main() -> int:
     per_category: dict[str, set[bytes]] = defaultdict(set)
     per_category_path: dict[str, set[str]] = defaultdict(set)
 
-    for sha in blobs:
-        hits = scan(run(["git", "cat-file", "-p", sha]))
+    for sha, data in read_blobs(blobs):
+        hits = scan(data)
         for cat, matches in hits.items():
             per_category[cat] |= matches
             per_category_path[cat] |= blob_paths.get(sha, set())
 
-    for sha in run(["git", "rev-list", "--all"]).decode().split():
-        hits = scan(run(["git", "log", "--format=%B", "-n", "1", sha]))
+    for sha, message in read_commit_messages():
+        hits = scan(message)
         for cat, matches in hits.items():
             per_category[cat] |= matches
             per_category_path[cat].add(f"<commit-msg:{sha[:10]}>")
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import re
 import subprocess  # nosec
+from collections.abc import Iterator
 from pathlib import Path
 
 BASE = Path(__file__).parent
@@ -70,6 +71,29 @@ def run(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
     return subprocess.run(args, cwd=cwd, check=False, capture_output=True)
 
 
+def read_blobs(shas: list[str], cwd: Path) -> Iterator[tuple[str, bytes]]:
+    """Yield (sha, content) for each blob from one `git cat-file --batch` process."""
+    proc = subprocess.Popen(
+        ["git", "cat-file", "--batch"], cwd=cwd, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    try:
+        for sha in shas:
+            proc.stdin.write(sha.encode() + b"\n")
+            proc.stdin.flush()
+            # "<sha> blob <size>", or "<sha> missing" for unknown objects
+            header = proc.stdout.readline().split()
+            if len(header) != 3:
+                yield sha, b""
+                continue
+            data = proc.stdout.read(int(header[2]))
+            proc.stdout.read(1)  # trailing LF
+            yield sha, data
+    finally:
+        proc.stdin.close()
+        proc.wait()
+
+
 def check_repo(name: str) -> dict:
     repo = BASE / name
     if not (repo / ".git").exists():
@@ -91,10 +115,6 @@ def check_repo(name: str) -> dict:
         parts = line.split(" ", 1)
         if len(parts) == 2:
             blob_shas.append(parts[0])
-    run(
-        ["git", "cat-file", "--batch-check=%(objecttype) %(objectname)"],
-        repo,
-    )
     # feed blobs on stdin via a separate Popen
     proc = subprocess.Popen(
         ["git", "cat-file", "--batch-check=%(objecttype) %(objectname)"],
@@ -109,8 +129,7 @@ def check_repo(name: str) -> dict:
 
     # scan each blob for abs paths and bad emails
     path_leaks = bad_email_content = 0
-    for sha in blobs:
-        data = run(["git", "cat-file", "-p", sha], repo).stdout
+    for _, data in read_blobs(blobs, repo):
         for m in ABS_PATH.findall(data):
             if any(s in m for s in ABS_PATH_SKIP):
                 continue
@@ -15,8 +15,15 @@ Exit codes:
 from __future__ import annotations
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Header exactly as written by add_spdx_headers.py
+CANONICAL_HEADER = (
+    b"# SPDX-FileCopyrightText: Copyright (c) provide.io llc. All rights reserved.\n"
+    b"# SPDX-License-Identifier: Apache-2.0\n"
+)
+
 EXCLUDED_PATTERNS = [
     ".venv/",
     "site-packages/",
@@ -27,35 +34,46 @@ EXCLUDED_PATTERNS = [
 ]
 
 
-def is_nearly_empty(file_path: Path) -> bool:
+def is_nearly_empty(file_path: Path, content: bytes) -> bool:
     """Check if __init__.py is nearly empty (skip requirement)."""
     if file_path.name == "__init__.py":
-        content = file_path.read_text()
-        lines = content.strip().split("\n")
+        lines = content.strip().split(b"\n")
         return len(lines) <= 3
     return False
 
 
-def check_file_has_header(file_path: Path) -> bool:
+def check_file_has_header(content: bytes) -> bool:
     """Check if file has SPDX header in first 15 lines."""
-    content = file_path.read_text()
-    lines = content.split("\n")[:15]
+    # Fast path: canonical header at the top, optionally after a shebang
+    start = content.find(b"\n") + 1 if content.startswith(b"#!") else 0
+    if content.startswith(CANONICAL_HEADER, start):
+        return True
+
+    # maxsplit keeps the rest of the file as one unsplit tail
+    lines = content.split(b"\n", 15)[:15]
 
-    has_copyright = any("SPDX-FileCopyrightText" in line for line in lines)
-    has_license = any("SPDX-License-Identifier: Apache-2.0" in line for line in lines)
+    has_copyright = any(b"SPDX-FileCopyrightText" in line for line in lines)
+    has_license = any(b"SPDX-License-Identifier: Apache-2.0" in line for line in lines)
 
     return has_copyright and has_license
 
 
 def should_skip(file_path: Path) -> bool:
-    """Determine if file should be skipped."""
+    """Determine if file should be skipped based on its path."""
     # Check exclusion patterns
-    for pattern in EXCLUDED_PATTERNS:
-        if pattern in str(file_path):
-            return True
+    path_str = str(file_path)
+    return any(pattern in path_str for pattern in EXCLUDED_PATTERNS)
+
+
+def check_file(file_path: Path) -> bool | None:
+    """Check one file. Returns None if it is exempt, else whether it has a header."""
+    # The tags are ASCII, so read raw bytes once and never decode the file
+    content = file_path.read_bytes()
 
     # Skip nearly empty __init__.py files
-    return bool(is_nearly_empty(file_path))
+    if is_nearly_empty(file_path, content):
+        return None
+    return check_file_has_header(content)
 
 
 def find_python_files(root: Path) -> list[Path]:
@@ -73,11 +91,13 @@ def main() -> int:
     root = Path.cwd()
     python_files = find_python_files(root)
 
-    missing_headers = []
-
-    for file_path in python_files:
-        if not check_file_has_header(file_path):
-            missing_headers.append(file_path)
+    # Check files concurrently; map() keeps input order so the report stays sorted
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(check_file, python_files))
+    checked = [
+        (f, has_header) for f, has_header in zip(python_files, results, strict=True) if has_header is not None
+    ]
+    missing_headers = [f for f, has_header in checked if not has_header]
 
     if missing_headers:
         print("❌ SPDX Header Validation Failed")
@@ -93,7 +113,7 @@ def main() -> int:
         print("Run: python scripts/add_spdx_headers.py")
         return 1
 
-    print(f"✅ All {len(python_files)} Python files have SPDX headers")
+    print(f"✅ All {len(checked)} Python files have SPDX headers")
     return 0
 
 